@@ -4,26 +4,39 @@ Atlassian Document Format (ADF) utilities.
 This module provides utilities for parsing ADF content from Jira Cloud.
 """
 
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
+# Markdown code delimiters
+_BACKTICK = "`"
+_CODE_FENCE_OPEN = "```\n"
+_CODE_FENCE_CLOSE = "\n```"
 
-def _has_code_mark(node: dict) -> bool:
+# ADF type names compared on the hot path
+_TEXT_TYPE = "text"
+_HARD_BREAK_TYPE = "hardBreak"
+_PARAGRAPH_TYPE = "paragraph"
+_CODE_BLOCK_TYPE = "codeBlock"
+_CODE_MARK_TYPE = "code"
+
+
+def _has_code_mark(node: dict[str, Any]) -> bool:
     """Check if a node has a code mark."""
-    if node.get("type") != "text":
+    if node.get("type") != _TEXT_TYPE:
         return False
     marks = node.get("marks", [])
-    return any(m.get("type") == "code" for m in marks)
+    return any(m.get("type") == _CODE_MARK_TYPE for m in marks)
 
 
-def _is_code_only_paragraph(node: dict) -> bool:
+def _is_code_only_paragraph(node: dict[str, Any]) -> bool:
     """
     Check if a node is a paragraph containing only code-marked text.
 
     This includes paragraphs with code text and hardBreaks only.
     """
-    if not isinstance(node, dict):
-        return False
-    if node.get("type") != "paragraph":
+    if node.get("type") != _PARAGRAPH_TYPE:
         return False
     content = node.get("content", [])
     if not content:
@@ -32,14 +45,14 @@ def _is_code_only_paragraph(node: dict) -> bool:
     for item in content:
         if not isinstance(item, dict):
             return False
-        if item.get("type") == "hardBreak":
+        if item.get("type") == _HARD_BREAK_TYPE:
             continue
         if not _has_code_mark(item):
             return False
     return True
 
 
-def _extract_code_from_paragraph(node: dict) -> list[str]:
+def _extract_code_from_paragraph(node: dict[str, Any]) -> list[str]:
     """
     Extract code lines from a code-only paragraph.
 
@@ -49,31 +62,86 @@ def _extract_code_from_paragraph(node: dict) -> list[str]:
     content = node.get("content", [])
     for item in content:
         if isinstance(item, dict):
-            if item.get("type") == "hardBreak":
+            if item.get("type") == _HARD_BREAK_TYPE:
                 lines.append("")
-            elif _has_code_mark(item):
-                text = _get_text_without_code_mark(item)
+                continue
+            has_code, text = _classify_text_node(item)
+            if has_code:
                 # Split by newlines to handle multiline content within single node
                 lines.extend(text.split("\n"))
     return lines
 
 
-def _get_text_without_code_mark(node: dict) -> str:
-    """Get text from a node, applying all marks except code."""
+def _classify_text_node(node: dict[str, Any]) -> tuple[bool, str]:
+    """
+    Scan the marks of a text node once.
+
+    Args:
+        node: ADF text node
+
+    Returns:
+        Tuple of (whether the node has a code mark, text with every mark
+        except code applied)
+    """
     text = node.get("text", "")
-    marks = node.get("marks", [])
-    # Apply all marks except code
-    non_code_marks = [m for m in marks if m.get("type") != "code"]
-    if non_code_marks:
-        text = _apply_marks(text, non_code_marks)
-    return text
+    marks = node.get("marks")
+    if not marks:
+        return False, text
+
+    has_code = False
+    other_marks: list[dict[str, Any]] = []
+    for mark in marks:
+        if mark.get("type") == _CODE_MARK_TYPE:
+            has_code = True
+        else:
+            other_marks.append(mark)
+    if other_marks:
+        text = _apply_marks(text, other_marks)
+    return has_code, text
+
+
+# Delimiters are (left, right) pairs; None means the mark adds no markup.
+_Delimiters = tuple[str, str]
 
 
-def _apply_marks(text: str, marks: list[dict]) -> str:
+def _mark_link(mark: dict[str, Any]) -> _Delimiters | None:
+    """Render a markdown link, keeping plain text if there is no href."""
+    href = (mark.get("attrs") or {}).get("href")
+    if href:
+        return ("[", "](" + str(href) + ")")
+    return None
+
+
+def _mark_subsup(mark: dict[str, Any]) -> _Delimiters | None:
+    """Render subscript or superscript text."""
+    subsup_type = (mark.get("attrs") or {}).get("type")
+    if subsup_type == "sub":
+        return ("<sub>", "</sub>")
+    if subsup_type == "sup":
+        return ("<sup>", "</sup>")
+    return None
+
+
+# Marks with fixed delimiters. Lookup cost does not depend on entry order.
+# textColor and backgroundColor are intentionally absent: colors are ignored
+# for plain text output.
+_MARK_DELIMITERS: dict[str, _Delimiters] = {
+    "strong": ("**", "**"),
+    "em": ("*", "*"),
+    "code": (_BACKTICK, _BACKTICK),
+    "strike": ("~~", "~~"),
+    "underline": ("<u>", "</u>"),
+}
+
+
+def _apply_marks(text: str, marks: list[dict[str, Any]]) -> str:
     """
     Apply ADF marks (formatting) to text.
 
-    Supports: code, strong, em, strike, underline, link, subsup.
+    Supports: strong, em, link, code, strike, underline, subsup.
+    Marks are applied in order, so the first mark is the innermost. The
+    delimiters are collected first and joined once, instead of rebuilding
+    the string for every mark.
 
     Args:
         text: The text content to format
@@ -85,130 +153,469 @@ def _apply_marks(text: str, marks: list[dict]) -> str:
     if not marks:
         return text
 
+    lefts: list[str] = []
+    rights: list[str] = []
     for mark in marks:
-        mark_type = mark.get("type")
-        if mark_type == "code":
-            text = f"`{text}`"
-        elif mark_type == "strong":
-            text = f"**{text}**"
-        elif mark_type == "em":
-            text = f"*{text}*"
-        elif mark_type == "strike":
-            text = f"~~{text}~~"
-        elif mark_type == "underline":
-            text = f"<u>{text}</u>"
-        elif mark_type == "link":
-            attrs = mark.get("attrs", {})
-            href = attrs.get("href", "")
-            if href:
-                text = f"[{text}]({href})"
-        elif mark_type == "subsup":
-            attrs = mark.get("attrs", {})
-            subsup_type = attrs.get("type")
-            if subsup_type == "sub":
-                text = f"<sub>{text}</sub>"
-            elif subsup_type == "sup":
-                text = f"<sup>{text}</sup>"
-        # textColor and backgroundColor are ignored for plain text output
+        mark_type = mark.get("type", "")
+        try:
+            delimiters = _MARK_DELIMITERS.get(mark_type)
+        except TypeError:
+            # Unhashable type (e.g. a list) - ignored like an unknown mark
+            continue
+        if delimiters is None:
+            # Marks whose delimiters depend on attrs, most common first
+            if mark_type == "link":
+                delimiters = _mark_link(mark)
+            elif mark_type == "subsup":
+                delimiters = _mark_subsup(mark)
+            if delimiters is None:
+                continue
+        lefts.append(delimiters[0])
+        rights.append(delimiters[1])
+
+    if not lefts:
+        return text
 
-    return text
+    lefts.reverse()
+    # A non-str text (e.g. a number) is stringified, as formatting would
+    lefts.append(str(text))
+    lefts.extend(rights)
+    return "".join(lefts)
+
+
+# A fenced code block is yielded as (open fence, code, close fence) so that it
+# can be emitted without first building the fenced string.
+_Fragment = str | tuple[str, ...]
+
+
+# Item classes assigned by _iter_text_fragments
+_CODE = 0
+_OTHER = 1
+_BREAK_BEFORE_CODE = 2
+
+
+def _code_fragment(lines: list[str]) -> _Fragment:
+    """Render a run of code lines as inline code or a fenced code block."""
+    # If it's just one line, use inline code
+    if len(lines) == 1:
+        return _BACKTICK + lines[0] + _BACKTICK
+    # Multiple lines -> code block
+    return (_CODE_FENCE_OPEN, "\n".join(lines), _CODE_FENCE_CLOSE)
 
 
-def _process_content_list(items: list) -> str | None:
+def _iter_text_fragments(items: list[Any]) -> Iterator[Any]:
     """
-    Process a list of ADF content items, merging consecutive code-marked text
+    Walk a list of ADF content items, merging consecutive code-marked text
     into proper code blocks.
 
     This handles both:
     1. Consecutive code-marked text nodes within a single paragraph
     2. Consecutive paragraphs that contain only code-marked text
 
+    Items are classified first and code runs collapsed afterwards, so the
+    merging never has to look ahead from inside the main loop.
+
     Args:
         items: List of ADF content items
 
-    Returns:
-        Processed text string or None if no content
+    Yields:
+        Fragments in document order: rendered text (str), fenced code blocks
+        (tuple of str pieces), or container items the caller must walk itself
     """
-    if not items:
-        return None
-
-    result_parts: list[str] = []
-    code_buffer: list[str] = []
-
-    def flush_code_buffer() -> None:
-        """Flush accumulated code lines into a code block."""
-        if code_buffer:
-            # If it's just one short line without newlines, use inline code
-            if len(code_buffer) == 1 and "\n" not in code_buffer[0]:
-                result_parts.append(f"`{code_buffer[0]}`")
+    count = len(items)
+    classes = [_OTHER] * count
+    # Code lines for code items; rendered text or the item itself otherwise
+    payloads: list[Any] = list(items)
+
+    # Classify back to front, so each hardBreak knows whether code-marked
+    # text follows it (looking past further hardBreaks)
+    code_follows = False
+    has_code = False
+    for i in range(count - 1, -1, -1):
+        item = items[i]
+        # ADF children are dicts, so index instead of type-checking each one
+        try:
+            item_type = item["type"]
+        except KeyError:
+            item_type = None
+        except TypeError:
+            # Not a node (e.g. a bare string) - rendered as-is, skipped here
+            continue
+        if item_type == _HARD_BREAK_TYPE:
+            payloads[i] = "\n"
+            if code_follows:
+                classes[i] = _BREAK_BEFORE_CODE
+            continue
+        code_follows = False
+        if item_type == _TEXT_TYPE:
+            code_follows, text = _classify_text_node(item)
+            if code_follows:
+                classes[i] = _CODE
+                # Split by newlines to handle multiline content
+                payloads[i] = text.split("\n")
+                has_code = True
             else:
-                # Multiple lines or contains newlines -> code block
-                code_content = "\n".join(code_buffer)
-                result_parts.append(f"```\n{code_content}\n```")
-            code_buffer.clear()
-
-    # Look ahead to determine if hardBreak is between code nodes
-    def is_followed_by_code(index: int) -> bool:
-        """Check if there's a code-marked text node after this index."""
-        for j in range(index + 1, len(items)):
-            next_item = items[j]
-            if isinstance(next_item, dict):
-                if _has_code_mark(next_item):
-                    return True
-                # Skip hardBreaks when looking ahead
-                if next_item.get("type") == "hardBreak":
-                    continue
-                # Any other node type means no code follows
-                return False
-        return False
+                # Plain text is already rendered - no need to visit it again
+                payloads[i] = text
+        elif _is_code_only_paragraph(item):
+            # Code-only paragraphs (document-level lists) join the code run
+            classes[i] = _CODE
+            payloads[i] = _extract_code_from_paragraph(item)
+            has_code = True
+        else:
+            # Render other leaves here too; only containers go back to the walk
+            try:
+                handler = _NODE_HANDLERS.get(item_type)
+            except TypeError:
+                # Unhashable type (e.g. a list) - walked as a container
+                handler = None
+            if handler:
+                payloads[i] = handler(item)
+
+    if not has_code:
+        # Nothing to merge - the common case for prose
+        yield from payloads
+        return
+
+    # Collect each run of code lines, flushing it at the first other item
+    code_lines: list[str] = []
+    for item_class, payload in zip(classes, payloads, strict=True):
+        if item_class == _CODE:
+            code_lines.extend(payload)
+        elif item_class == _BREAK_BEFORE_CODE and code_lines:
+            # A hardBreak between code nodes becomes an empty line of code
+            code_lines.append("")
+        else:
+            if code_lines:
+                yield _code_fragment(code_lines)
+                code_lines = []
+            yield payload
+    if code_lines:
+        yield _code_fragment(code_lines)
 
-    in_code_block = False
 
-    for i, item in enumerate(items):
-        # Check if this is a code-only paragraph (for document-level lists)
-        if isinstance(item, dict) and _is_code_only_paragraph(item):
-            code_lines = _extract_code_from_paragraph(item)
-            if code_lines:
-                in_code_block = True
-                code_buffer.extend(code_lines)
+class _ListFrame:
+    """Work-stack entry for a content list that is being rendered."""
+
+    __slots__ = ("fenced", "items", "need_newline", "started")
+
+    def __init__(self, items: list[Any], *, fenced: bool = False) -> None:
+        self.items = _iter_text_fragments(items)
+        # Content of a codeBlock node is wrapped in a fenced block
+        self.fenced = fenced
+        # Whether the list has produced any output, i.e. whether its parent
+        # has already emitted the separator in front of it
+        self.started = False
+        # Whether the next child needs a newline in front of it
+        self.need_newline = False
+
+
+def _render_text(node: dict[str, Any]) -> str:
+    """Render a text node with its marks."""
+    text: str = node.get("text", "")
+    # Handle marks (formatting like code, strong, em, etc.)
+    marks = node.get("marks", [])
+    if marks:
+        text = _apply_marks(text, marks)
+    return text
+
+
+def _render_hard_break(node: dict[str, Any]) -> str:
+    """Render a hardBreak node."""
+    return "\n"
+
+
+def _render_mention(node: dict[str, Any]) -> str:
+    """Render a mention node, falling back to the user id."""
+    attrs = node.get("attrs") or {}
+    text: str | None = attrs.get("text")
+    if text:
+        return text
+    return "@" + str(attrs.get("id", "unknown"))
+
+
+def _render_emoji(node: dict[str, Any]) -> str:
+    """Render an emoji node, falling back to the short name."""
+    attrs = node.get("attrs") or {}
+    text: str = attrs.get("text") or attrs.get("shortName", "")
+    return text
+
+
+@lru_cache(maxsize=1024)
+def _format_adf_date(timestamp: str | int) -> str:
+    """
+    Format an ADF date timestamp (milliseconds since epoch) as YYYY-MM-DD.
+
+    Cached because bulk fetches tend to repeat the same dates across issues.
+
+    Args:
+        timestamp: Raw timestamp from the date node's attrs
+
+    Returns:
+        Formatted date, or the raw timestamp if it cannot be parsed
+    """
+    try:
+        dt = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+        return dt.strftime("%Y-%m-%d")
+    except (ValueError, OSError, TypeError):
+        return str(timestamp)
+
+
+def _render_date(node: dict[str, Any]) -> str:
+    """Render a date node as YYYY-MM-DD."""
+    timestamp = (node.get("attrs") or {}).get("timestamp")
+    if timestamp:
+        try:
+            return _format_adf_date(timestamp)
+        except TypeError:
+            # Unhashable timestamp - cannot be cached or parsed
+            return str(timestamp)
+    return ""
+
+
+def _render_status(node: dict[str, Any]) -> str:
+    """Render a status lozenge as [text]."""
+    attrs = node.get("attrs") or {}
+    return "[" + str(attrs.get("text", "")) + "]"
+
+
+def _render_inline_card(node: dict[str, Any]) -> str:
+    """Render an inlineCard node as the card's URL or name."""
+    attrs = node.get("attrs") or {}
+    url: str | None = attrs.get("url")
+    if url:
+        return url
+    data = attrs.get("data") or {}
+    name: str = data.get("url") or data.get("name", "")
+    return name
+
+
+# Node type -> renderer for leaf nodes. Container nodes are not listed here;
+# they are walked through their content list.
+_NODE_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "text": _render_text,
+    "hardBreak": _render_hard_break,
+    "mention": _render_mention,
+    "emoji": _render_emoji,
+    "date": _render_date,
+    "status": _render_status,
+    "inlineCard": _render_inline_card,
+}
+
+# Node types rendered without descending into content
+_LEAF_TYPES = frozenset(_NODE_HANDLERS)
+
+
+def _is_leaf_type(node_type: Any) -> bool:
+    """Check if a node type is rendered without descending into content."""
+    return type(node_type) is str and node_type in _LEAF_TYPES
+
+
+# Returned by next() once a frame has no items left
+_EXHAUSTED = object()
+
+
+def _visit(node: Any, stack: list[_ListFrame]) -> str | None:
+    """
+    Render a single ADF node, or push it onto the work stack.
+
+    Leaf nodes are rendered immediately. Nodes with a content list push a
+    frame onto ``stack`` and return None; the frame's result is delivered to
+    its parent once all of its children have been rendered.
+
+    Args:
+        node: ADF node (dict), content list, string, or None
+        stack: Work stack of content lists being rendered
+
+    Returns:
+        Rendered text, or None if no content or a frame was pushed
+    """
+    while True:
+        # Nodes are by far the most common input, so they are checked first
+        if not isinstance(node, dict):
+            if isinstance(node, str):
+                return node
+            if not isinstance(node, list) or not node:
+                return None
+            # A lone container child renders exactly like the list around it,
+            # so unwrap doc -> panel -> paragraph chains without a frame each.
+            # Leaves and code-only paragraphs are excluded: code merging and
+            # empty-text handling depend on being inside a list.
+            child = node[0]
+            if (
+                len(node) == 1
+                and isinstance(child, dict)
+                and not _is_leaf_type(child.get("type"))
+                and not _is_code_only_paragraph(child)
+            ):
+                node = child
+                continue
+            stack.append(_ListFrame(node))
+            return None
+
+        node_type: Any = node.get("type")
+        # Fast path for the most common node: plain text without marks
+        if node_type == _TEXT_TYPE and not node.get("marks"):
+            text: str = node.get("text", "")
+            return text
+
+        try:
+            handler = _NODE_HANDLERS.get(node_type)
+        except TypeError:
+            # Unhashable type (e.g. a list) - walked as a container
+            handler = None
+        if handler:
+            return handler(node)
+
+        # Check if this is a codeBlock node
+        if node_type == _CODE_BLOCK_TYPE:
+            code_content = node.get("content") or []
+            if not isinstance(code_content, list):
+                # A lone node or string, rendered as a one-item list
+                code_content = [code_content]
+            stack.append(_ListFrame(code_content, fenced=True))
+            return None
+
+        # Descend into the node's content without growing the stack
+        content = node.get("content")
+        if not content:
+            return None
+        node = content
+
+
+def _start_frames(stack: list[_ListFrame]) -> Iterator[str]:
+    """
+    Emit what must precede the first output of the frame on top of the stack.
+
+    Frames without output so far form the top of the stack. The outermost of
+    them gets its newline separator, if its parent already has output, and
+    each of them opens its code fence if it is a codeBlock.
+
+    Args:
+        stack: Work stack whose top frame is about to produce output
+
+    Yields:
+        Separator and code fence pieces
+    """
+    first = len(stack) - 1
+    while first > 0 and not stack[first - 1].started:
+        first -= 1
+    if first > 0 and stack[first - 1].need_newline:
+        yield "\n"
+    for i in range(first, len(stack)):
+        if i > 0:
+            stack[i - 1].need_newline = True
+        frame = stack[i]
+        frame.started = True
+        if frame.fenced:
+            yield _CODE_FENCE_OPEN
+
+
+def _iter_stack_text(stack: list[_ListFrame]) -> Iterator[str]:
+    """
+    Render the content lists on the work stack, yielding output in order.
+
+    Children of a list are separated by newlines. Because a nested list may
+    turn out to render nothing, its separator is only emitted together with
+    its first piece of output.
+
+    Args:
+        stack: Work stack of content lists being rendered
+
+    Yields:
+        Pieces of rendered text
+    """
+    while stack:
+        frame = stack[-1]
+        item = next(frame.items, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            # A codeBlock renders its fences even when it has no content
+            if frame.fenced:
+                if not frame.started:
+                    yield from _start_frames(stack)
+                yield _CODE_FENCE_CLOSE
+            stack.pop()
+            continue
+
+        if type(item) is not str and type(item) is not tuple:
+            # A container node: None if it has no text or pushed a frame
+            item = _visit(item, stack)
+        if not item:
             continue
 
-        if isinstance(item, dict) and _has_code_mark(item):
-            # This is a code-marked text node - accumulate it
-            in_code_block = True
-            text = _get_text_without_code_mark(item)
-            # Split by newlines to handle multiline content
-            lines = text.split("\n")
-            code_buffer.extend(lines)
-        elif (
-            isinstance(item, dict)
-            and item.get("type") == "hardBreak"
-            and in_code_block
-            and is_followed_by_code(i)
-        ):
-            # hardBreak between code nodes - add as newline in code
-            code_buffer.append("")
+        if not frame.started:
+            yield from _start_frames(stack)
+        elif frame.need_newline:
+            yield "\n"
+        frame.need_newline = True
+        if type(item) is str:
+            yield item
         else:
-            # Not code-marked - flush any accumulated code first
-            in_code_block = False
-            flush_code_buffer()
-            # Process this item normally
-            text = adf_to_text(item)
-            if text:
-                result_parts.append(text)
+            yield from item
 
-    # Flush any remaining code
-    flush_code_buffer()
 
-    return "\n".join(result_parts) if result_parts else None
+def adf_iter_text(
+    adf_content: dict[str, Any] | list[Any] | str | None,
+) -> Iterator[str]:
+    """
+    Lazily convert Atlassian Document Format (ADF) content to plain text.
+
+    Yields the same text as ``adf_to_text`` in document-order pieces, walking
+    the document only as far as the caller consumes. Callers that need a
+    preview can stop early, e.g. with ``itertools.islice``.
 
+    Args:
+        adf_content: ADF document (dict), content list, string, or None
 
-def adf_to_text(adf_content: dict | list | str | None) -> str | None:
+    Yields:
+        Pieces of plain text; joined they equal ``adf_to_text`` (an empty
+        document yields nothing)
+    """
+    stack: list[_ListFrame] = []
+    text = _visit(adf_content, stack)
+    if text:
+        yield text
+    yield from _iter_stack_text(stack)
+
+
+def _render_document(
+    adf_content: Any, stack: list[_ListFrame], pieces: list[str]
+) -> str | None:
+    """
+    Render a whole document using the given, empty, work stack and buffer.
+
+    Both are left empty again afterwards so that they can be reused.
+
+    Args:
+        adf_content: ADF document (dict), content list, string, or None
+        stack: Empty work stack
+        pieces: Empty output buffer
+
+    Returns:
+        Plain text string or None if no content
+    """
+    text = _visit(adf_content, stack)
+    if not stack:
+        # A leaf, string or empty document
+        return text
+    pieces.extend(_iter_stack_text(stack))
+    text = "".join(pieces) or None
+    pieces.clear()
+    return text
+
+
+def adf_to_text(adf_content: dict[str, Any] | list[Any] | str | None) -> str | None:
     """
     Convert Atlassian Document Format (ADF) content to plain text.
 
     ADF is Jira Cloud's rich text format returned for fields like description.
-    This function recursively extracts text content from the ADF structure.
+    The document tree is walked iteratively with an explicit work stack, so
+    deeply nested content (lists, panels, tables) cannot exhaust Python's
+    recursion limit.
+
+    The input is the plain dict/list/str structure produced by any JSON
+    decoder (``json``, ``orjson``, or ``requests``' ``Response.json()`` as used
+    by the Atlassian client). No particular decoder is required.
 
     Args:
         adf_content: ADF document (dict), content list, string, or None
@@ -216,76 +623,25 @@ def adf_to_text(adf_content: dict | list | str | None) -> str | None:
     Returns:
         Plain text string or None if no content
     """
-    if adf_content is None:
-        return None
-
-    if isinstance(adf_content, str):
-        return adf_content
-
-    if isinstance(adf_content, list):
-        return _process_content_list(adf_content)
-
-    if isinstance(adf_content, dict):
-        # Check if this is a text node
-        if adf_content.get("type") == "text":
-            text = adf_content.get("text", "")
-            # Handle marks (formatting like code, strong, em, etc.)
-            marks = adf_content.get("marks", [])
-            if marks:
-                text = _apply_marks(text, marks)
-            return text
+    return _render_document(adf_content, [], [])
 
-        # Check if this is a hardBreak node
-        if adf_content.get("type") == "hardBreak":
-            return "\n"
-
-        # Check if this is a mention node
-        if adf_content.get("type") == "mention":
-            attrs = adf_content.get("attrs", {})
-            return attrs.get("text") or f"@{attrs.get('id', 'unknown')}"
-
-        # Check if this is an emoji node
-        if adf_content.get("type") == "emoji":
-            attrs = adf_content.get("attrs", {})
-            return attrs.get("text") or attrs.get("shortName", "")
-
-        # Check if this is a date node
-        if adf_content.get("type") == "date":
-            attrs = adf_content.get("attrs", {})
-            timestamp = attrs.get("timestamp")
-            if timestamp:
-                try:
-                    dt = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
-                    return dt.strftime("%Y-%m-%d")
-                except (ValueError, OSError, TypeError):
-                    return str(timestamp)
-            return ""
-
-        # Check if this is a status node
-        if adf_content.get("type") == "status":
-            attrs = adf_content.get("attrs", {})
-            return f"[{attrs.get('text', '')}]"
-
-        # Check if this is an inlineCard node
-        if adf_content.get("type") == "inlineCard":
-            attrs = adf_content.get("attrs", {})
-            url = attrs.get("url")
-            if url:
-                return url
-            data = attrs.get("data", {})
-            return data.get("url") or data.get("name", "")
 
-        # Check if this is a codeBlock node
-        if adf_content.get("type") == "codeBlock":
-            content = adf_content.get("content", [])
-            code_text = adf_to_text(content) or ""
-            return f"```\n{code_text}\n```"
+def adf_to_text_batch(
+    docs: Iterable[dict[str, Any] | list[Any] | str | None],
+) -> list[str | None]:
+    """
+    Convert many ADF documents to plain text, e.g. a page of issue descriptions.
 
-        # Recursively process content
-        content = adf_content.get("content")
-        if content:
-            return adf_to_text(content)
+    Equivalent to calling ``adf_to_text`` on each document, but one work stack
+    and output buffer are reused across the whole batch. Both are local to
+    the call, so concurrent batches on different threads share nothing.
 
-        return None
+    Args:
+        docs: ADF documents (dict), content lists, strings, or None
 
-    return None
+    Returns:
+        Plain text (or None) for each document, in order
+    """
+    stack: list[_ListFrame] = []
+    pieces: list[str] = []
+    return [_render_document(doc, stack, pieces) for doc in docs]
@@ -5,7 +5,14 @@ These tests validate the conversion of ADF content to plain text,
 including handling of various inline and block node types.
 """
 
-from src.mcp_atlassian.models.jira.adf import adf_to_text
+import json
+from itertools import islice
+
+from src.mcp_atlassian.models.jira.adf import (
+    adf_iter_text,
+    adf_to_text,
+    adf_to_text_batch,
+)
 
 
 class TestAdfToText:
@@ -73,6 +80,21 @@ class TestAdfToText:
         node = {"type": "mention"}
         assert adf_to_text(node) == "@unknown"
 
+    def test_mention_non_string_id(self):
+        """Test mention node with a numeric id is stringified."""
+        node = {"type": "mention", "attrs": {"id": 123}}
+        assert adf_to_text(node) == "@123"
+
+    def test_repeated_mentions(self):
+        """Test repeated and differing mentions each render their own text."""
+        nodes = [
+            {"type": "mention", "attrs": {"id": "1", "text": "@Ann"}},
+            {"type": "mention", "attrs": {"id": "2", "text": "@Bob"}},
+            {"type": "mention", "attrs": {"id": "1", "text": "@Ann"}},
+            {"type": "mention", "attrs": {"id": "3"}},
+        ]
+        assert adf_to_text(nodes) == "@Ann\n@Bob\n@Ann\n@3"
+
     # Emoji node tests
 
     def test_emoji_with_text(self):
@@ -141,6 +163,11 @@ class TestAdfToText:
         node = {"type": "status"}
         assert adf_to_text(node) == "[]"
 
+    def test_status_node_non_string_text(self):
+        """Test status node with a non-string text is stringified."""
+        node = {"type": "status", "attrs": {"text": 5}}
+        assert adf_to_text(node) == "[5]"
+
     # inlineCard node tests
 
     def test_inline_card_with_url(self):
@@ -203,6 +230,16 @@ class TestAdfToText:
         node = {"type": "codeBlock"}
         assert adf_to_text(node) == "```\n\n```"
 
+    def test_code_block_string_content(self):
+        """Test codeBlock node whose content is a string rather than a list."""
+        node = {"type": "codeBlock", "content": "ab"}
+        assert adf_to_text(node) == "```\nab\n```"
+
+    def test_code_block_node_content(self):
+        """Test codeBlock node whose content is a single node."""
+        node = {"type": "codeBlock", "content": {"type": "text", "text": "x"}}
+        assert adf_to_text(node) == "```\nx\n```"
+
     # Nested content tests
 
     def test_paragraph_with_text(self):
@@ -261,6 +298,13 @@ class TestAdfToText:
         }
         assert adf_to_text(node) == "nested text"
 
+    def test_unhashable_node_type(self):
+        """Test node with an unhashable type still renders its content."""
+        node = {"type": ["x"], "content": [{"type": "text", "text": "a"}]}
+        assert adf_to_text(node) == "a"
+        assert adf_to_text([node, {"type": {}}]) == "a"
+        assert adf_to_text({"type": "doc", "content": [node]}) == "a"
+
     def test_deeply_nested_content(self):
         """Test deeply nested ADF structure."""
         node = {
@@ -284,6 +328,67 @@ class TestAdfToText:
         }
         assert adf_to_text(node) == "Item 1"
 
+    def test_single_child_chain(self):
+        """Test a long chain of single-child containers renders its leaf."""
+        node: dict = {
+            "type": "paragraph",
+            "content": [{"type": "text", "text": "leaf", "marks": [{"type": "em"}]}],
+        }
+        for _ in range(5000):
+            node = {"type": "panel", "content": [node]}
+        assert adf_to_text({"type": "doc", "content": [node]}) == "*leaf*"
+
+    def test_single_code_paragraph_keeps_trailing_hardbreak(self):
+        """Test a lone code-only paragraph is still merged as a code block."""
+        doc = {
+            "type": "doc",
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [
+                        {"type": "text", "text": "a", "marks": [{"type": "code"}]},
+                        {"type": "hardBreak"},
+                    ],
+                }
+            ],
+        }
+        assert adf_to_text(doc) == "```\na\n\n```"
+
+    def test_decoded_json_document(self):
+        """Test rendering a document freshly decoded from JSON."""
+        raw = json.dumps(
+            {
+                "type": "doc",
+                "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": "Run"}]},
+                    {
+                        "type": "codeBlock",
+                        "content": [{"type": "text", "text": "make test"}],
+                    },
+                    {
+                        "type": "paragraph",
+                        "content": [
+                            {"type": "text", "text": "a", "marks": [{"type": "code"}]},
+                            {"type": "hardBreak"},
+                            {"type": "text", "text": "b", "marks": [{"type": "code"}]},
+                        ],
+                    },
+                ],
+            }
+        )
+        assert (
+            adf_to_text(json.loads(raw)) == "Run\n```\nmake test\n```\n```\na\n\nb\n```"
+        )
+
+    def test_nesting_beyond_recursion_limit(self):
+        """Test nesting deeper than the recursion limit does not raise."""
+        node: dict = {"type": "text", "text": "deep"}
+        for _ in range(5000):
+            node = {"type": "bulletList", "content": [node, {"type": "hardBreak"}]}
+        result = adf_to_text(node)
+        assert result is not None
+        assert result.startswith("deep\n")
+
     # Mark tests (inline formatting)
 
     def test_code_mark(self):
@@ -349,6 +454,22 @@ class TestAdfToText:
         }
         assert adf_to_text(node) == "orphan link"
 
+    def test_link_mark_non_string_href(self):
+        """Test link mark with a non-string href is stringified."""
+        node = {
+            "type": "text",
+            "text": "x",
+            "marks": [{"type": "link", "attrs": {"href": 5}}],
+        }
+        assert adf_to_text(node) == "[x](5)"
+
+    def test_marks_on_non_string_text(self):
+        """Test marked text that is not a string is stringified."""
+        node = {"type": "text", "text": 5, "marks": [{"type": "strong"}]}
+        assert adf_to_text(node) == "**5**"
+        node = {"type": "text", "text": None, "marks": [{"type": "em"}]}
+        assert adf_to_text(node) == "*None*"
+
     def test_subscript_mark(self):
         """Test text with subsup subscript mark."""
         node = {
@@ -377,6 +498,19 @@ class TestAdfToText:
         # Multiple marks are applied sequentially
         assert adf_to_text(node) == "***important***"
 
+    def test_multiple_marks_nest_in_order(self):
+        """Test the first mark is innermost and later marks wrap it."""
+        node = {
+            "type": "text",
+            "text": "docs",
+            "marks": [
+                {"type": "strong"},
+                {"type": "link", "attrs": {"href": "https://example.com"}},
+                {"type": "subsup", "attrs": {"type": "sup"}},
+            ],
+        }
+        assert adf_to_text(node) == "<sup>[**docs**](https://example.com)</sup>"
+
     def test_code_mark_in_paragraph(self):
         """Test code mark within a paragraph with other text."""
         node = {
@@ -614,3 +748,100 @@ class TestAdfToText:
             "marks": [{"type": "unknownMark"}],
         }
         assert adf_to_text(node) == "text"
+
+    def test_unhashable_mark_type(self):
+        """Test mark with an unhashable type is ignored."""
+        node = {
+            "type": "text",
+            "text": "text",
+            "marks": [{"type": ["strong"]}, {"type": "em"}],
+        }
+        assert adf_to_text(node) == "*text*"
+
+
+class TestAdfIterText:
+    """Tests for the adf_iter_text function."""
+
+    def _doc(self) -> dict:
+        return {
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "Intro"}]},
+                {"type": "paragraph", "content": []},
+                {
+                    "type": "bulletList",
+                    "content": [
+                        {
+                            "type": "listItem",
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "one"}],
+                                },
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "two"}],
+                                },
+                            ],
+                        }
+                    ],
+                },
+                {"type": "codeBlock", "content": [{"type": "text", "text": "x = 1"}]},
+                {"type": "codeBlock"},
+            ],
+        }
+
+    def test_joined_pieces_match_adf_to_text(self):
+        """Test the pieces join to the same text as adf_to_text."""
+        doc = self._doc()
+        expected = "Intro\none\ntwo\n```\nx = 1\n```\n```\n\n```"
+        assert adf_to_text(doc) == expected
+        assert "".join(adf_iter_text(doc)) == expected
+
+    def test_stops_early(self):
+        """Test a consumer can stop after the first pieces."""
+        pieces = list(islice(adf_iter_text(self._doc()), 3))
+        assert "".join(pieces) == "Intro\none"
+
+    def test_leaf_input(self):
+        """Test a single leaf node yields its text."""
+        assert list(adf_iter_text({"type": "hardBreak"})) == ["\n"]
+
+    def test_empty_input(self):
+        """Test empty content yields nothing."""
+        assert list(adf_iter_text(None)) == []
+        assert list(adf_iter_text({"type": "doc", "content": []})) == []
+
+
+class TestAdfToTextBatch:
+    """Tests for the adf_to_text_batch function."""
+
+    def test_matches_adf_to_text(self):
+        """Test each result equals adf_to_text of the same document."""
+        docs = [
+            {
+                "type": "doc",
+                "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": "A"}]},
+                    {"type": "paragraph", "content": [{"type": "text", "text": "B"}]},
+                ],
+            },
+            None,
+            {"type": "text", "text": ""},
+            {"type": "doc", "content": []},
+            {"type": "codeBlock", "content": [{"type": "text", "text": "x"}]},
+            "plain",
+        ]
+        assert adf_to_text_batch(docs) == [adf_to_text(doc) for doc in docs]
+        assert adf_to_text_batch(docs) == [
+            "A\nB",
+            None,
+            "",
+            None,
+            "```\nx\n```",
+            "plain",
+        ]
+
+    def test_empty_batch(self):
+        """Test an empty batch returns an empty list."""
+        assert adf_to_text_batch([]) == []